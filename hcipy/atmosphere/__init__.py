@@ -4,6 +4,7 @@ __all__ = [
 	'phase_covariance_von_karman',
 	'phase_structure_function_von_karman',
 	'power_spectral_density_von_karman',
+	'make_von_karman_covariance_operator',
 	'Cn_squared_from_fried_parameter',
 	'fried_parameter_from_Cn_squared',
 	'seeing_to_fried_parameter',
@@ -1,12 +1,68 @@
 from __future__ import division
 
+import itertools
+
 from ..optics import OpticalElement
-from ..field import Field
+from ..field import Field, CartesianGrid, SeparatedCoords
 from ..propagation import FresnelPropagator
 
 import numpy as np
+import numexpr as ne
+from scipy.interpolate import CubicSpline
 from scipy.special import gamma, kv
 
+_kv56_table = None
+_kv56_log_x_bounds = (np.log(1e-8), np.log(700))
+
+def _kv56(x):
+	'''Evaluate the modified Bessel function kv(5/6, x) using a lookup table.
+
+	The Bessel function is by far the most expensive part of the Von Karman
+	covariance and structure functions. As it is a smooth one-dimensional
+	function, it is tabulated once on a log-spaced grid and interpolated
+	with a cubic spline. Arguments outside of the tabulated range fall
+	back to the exact scipy evaluation.
+
+	Parameters
+	----------
+	x : array_like
+		The argument of the Bessel function. All values should be positive.
+
+	Returns
+	-------
+	ndarray
+		The interpolated value of kv(5/6, x).
+	'''
+	x = np.asarray(x)
+
+	# On centered, regularly-spaced grids many radii coincide due to the
+	# grid symmetry, so typically only ~N/4 arguments are distinct.
+	# Evaluate each unique argument once and scatter the results back.
+	x_unique, inverse = np.unique(x, return_inverse=True)
+
+	if x_unique.size <= x.size // 2:
+		return _kv56_evaluate(x_unique)[inverse].reshape(x.shape)
+
+	return _kv56_evaluate(x)
+
+def _kv56_evaluate(x):
+	'''Evaluate kv(5/6, x) from the lookup table without deduplication.
+	'''
+	global _kv56_table
+
+	if _kv56_table is None:
+		log_x = np.linspace(_kv56_log_x_bounds[0], _kv56_log_x_bounds[1], 2000)
+		_kv56_table = CubicSpline(log_x, kv(5 / 6, np.exp(log_x)))
+
+	log_x = np.log(x)
+	outside = (log_x < _kv56_log_x_bounds[0]) | (log_x > _kv56_log_x_bounds[1])
+
+	res = _kv56_table(log_x)
+	if np.any(outside):
+		res[outside] = kv(5 / 6, x[outside])
+
+	return res
+
 class AtmosphericLayer(OpticalElement):
 	'''A single infinitely-thin atmospheric layer.
 
@@ -44,6 +100,8 @@ class AtmosphericLayer(OpticalElement):
 		The height of the atmospheric layer above the ground.
 	'''
 	def __init__(self, input_grid, Cn_squared=None, L0=np.inf, velocity=0, height=0):
+		self._phasor_cache = None
+
 		self.input_grid = input_grid
 		self.Cn_squared = Cn_squared
 		self.L0 = L0
@@ -140,14 +198,99 @@ class AtmosphericLayer(OpticalElement):
 	def output_grid(self):
 		return self.input_grid
 
-	def forward(self, wf):
-		wf = wf.copy()
-		wf.electric_field *= np.exp(1j * self.phase_for(wf.wavelength))
+	def _invalidate_phasor_cache(self):
+		'''Invalidate the cached phasor.
+
+		This function should be called by derived classes whenever the phase
+		screen changes without a change in time, eg. on a reset or when the
+		turbulence strength is modified.
+		'''
+		self._phasor_cache = None
+
+	def _phasor_for(self, wavelength):
+		'''Get the complex phasor exp(1j * phase) at a certain wavelength.
+
+		The last-computed phasor is cached, keyed on wavelength and time, so
+		repeated propagations through an unchanged layer (eg. a forward
+		followed by a backward, or many wavefronts at the same wavelength)
+		only evaluate the phase screen and the complex exponential once.
+
+		Parameters
+		----------
+		wavelength : scalar
+			The wavelength at which to calculate the phasor.
+		'''
+		key = (wavelength, self._t)
+
+		if self._phasor_cache is None or self._phasor_cache[0] != key:
+			phase = self.phase_for(wavelength)
+
+			# A spatially-constant phase screen, eg. a layer with zero
+			# turbulence strength, only adds a global piston. Detect this
+			# with a cheap subsampled probe before checking the full screen,
+			# and collapse the phasor to a scalar so the propagation reduces
+			# to a scalar multiplication.
+			probe = phase[::max(phase.size // 64, 1)]
+
+			if np.ptp(probe) == 0 and np.ptp(phase) == 0:
+				phasor = np.exp(1j * phase[0])
+			else:
+				# As the phase is purely real, evaluating cos + 1j * sin in a
+				# single fused pass is faster than the general complex exp.
+				phasor = Field(ne.evaluate('complex(cos(phase), sin(phase))', local_dict={'phase': phase}), phase.grid)
+
+			self._phasor_cache = (key, phasor)
+
+		return self._phasor_cache[1]
+
+	def forward(self, wf, inplace=False):
+		'''Propagate a wavefront through the atmospheric layer.
+
+		The electric field may carry leading tensor axes, eg. a batch of
+		wavefronts at the same wavelength; the phasor broadcasts over these,
+		so the whole batch is applied in a single vectorized operation.
+
+		Parameters
+		----------
+		wf : Wavefront
+			The wavefront to propagate.
+		inplace : boolean
+			Whether the wavefront may be modified in place. This avoids a
+			full copy of the electric field for callers that do not need
+			the input wavefront afterwards. The default is False.
+
+		Returns
+		-------
+		Wavefront
+			The propagated wavefront.
+		'''
+		if not inplace:
+			wf = wf.copy()
+
+		wf.electric_field *= self._phasor_for(wf.wavelength)
 		return wf
 
-	def backward(self, wf):
-		wf = wf.copy()
-		wf.electric_field *= np.exp(-1j * self.phase_for(wf.wavelength))
+	def backward(self, wf, inplace=False):
+		'''Propagate a wavefront backwards through the atmospheric layer.
+
+		Parameters
+		----------
+		wf : Wavefront
+			The wavefront to propagate.
+		inplace : boolean
+			Whether the wavefront may be modified in place. This avoids a
+			full copy of the electric field for callers that do not need
+			the input wavefront afterwards. The default is False.
+
+		Returns
+		-------
+		Wavefront
+			The propagated wavefront.
+		'''
+		if not inplace:
+			wf = wf.copy()
+
+		wf.electric_field *= self._phasor_for(wf.wavelength).conj()
 		return wf
 
 class MultiLayerAtmosphere(OpticalElement):
@@ -175,6 +318,9 @@ class MultiLayerAtmosphere(OpticalElement):
 
 			scintillation = scintilation
 
+		self._phasor_cache = {}
+		self._propagator_cache = {}
+
 		self.layers = layers
 		self._scintillation = scintillation
 		self._t = 0
@@ -182,37 +328,69 @@ class MultiLayerAtmosphere(OpticalElement):
 
 		self.calculate_propagators()
 
+	def _get_propagator(self, grid, distance):
+		'''Get a memoized FresnelPropagator for a certain propagation distance.
+
+		Each propagator caches its internal Fourier filter, so reusing
+		instances across recalculations avoids replanning the FFTs.
+		'''
+		key = (hash(grid), distance)
+
+		if key not in self._propagator_cache:
+			self._propagator_cache[key] = FresnelPropagator(grid, distance)
+
+		return self._propagator_cache[key]
+
 	def calculate_propagators(self):
 		'''Recalculates the list of optical elements used for a propagation.
 
-		This function is called automatically by other functions, but a recalculation
-		can be forced by calling it explicitly.
+		This also refreshes the internal per-layer snapshots of the heights,
+		Cn^2 values and outer scales. This function is called automatically
+		by other functions, but a recalculation can be forced by calling it
+		explicitly, eg. after modifying an attribute on one of the layers
+		directly.
 		'''
-		heights = np.array([l.height for l in self.layers])
+		# Snapshot the per-layer scalar attributes in a structure-of-arrays
+		# layout, so aggregations over the layers become numpy reductions
+		# instead of per-attribute Python lookups.
+		num_layers = len(self.layers)
+		self._layer_heights = np.fromiter((l.height for l in self.layers), 'float', num_layers)
+		self._layer_Cn_squared = np.fromiter((l.Cn_squared for l in self.layers), 'float', num_layers)
+		self._layer_outer_scales = np.fromiter((l.outer_scale for l in self.layers), 'float', num_layers)
+
+		heights = self._layer_heights
 		layer_indices = np.argsort(-heights)
 
-		sorted_heights = heights[layer_indices]
-		delta_heights = sorted_heights[:-1] - sorted_heights[1:]
-		grid = self.layers[0].input_grid
+		sorted_layers = [self.layers[i] for i in layer_indices]
 
 		if self.scintillation:
-			propagators = [FresnelPropagator(grid, h) for h in delta_heights]
+			sorted_heights = heights[layer_indices]
+			delta_heights = sorted_heights[:-1] - sorted_heights[1:]
+			grid = self.layers[0].input_grid
+
+			propagators = [self._get_propagator(grid, h) for h in delta_heights]
 
-		self.elements = []
-		for i, j in enumerate(layer_indices):
-			self.elements.append(self.layers[j])
-			if self.scintillation and i < len(propagators):
-				self.elements.append(propagators[i])
+			self.elements = list(itertools.chain.from_iterable(zip(sorted_layers, propagators)))
+			self.elements.append(sorted_layers[-1])
+
+			if sorted_heights[-1] > 0:
+				self.elements.append(self._get_propagator(grid, sorted_heights[-1]))
+		else:
+			self.elements = sorted_layers
 
-		if self.scintillation and sorted_heights[-1] > 0:
-			self.elements.append(FresnelPropagator(grid, sorted_heights[-1]))
+		# Prebuild the reversed element list, so backward propagations do
+		# not reverse the elements on every call.
+		self._elements_backward = list(reversed(self.elements))
 
 		self._dirty = False
+		self._phasor_cache = {}
 
 	def reset(self):
 		for l in self.layers:
 			l.reset()
 
+		self._phasor_cache = {}
+
 	@property
 	def layers(self):
 		'''A list of :class:`AtmosphericLayer` objects.
@@ -224,13 +402,19 @@ class MultiLayerAtmosphere(OpticalElement):
 		self._layers = layers
 		self._dirty = True
 
-	def phase_for(self, wavelength):
+	def phase_for(self, wavelength, dtype=None):
 		'''Get the unwrapped phase in radians for the atmosphere.
 
 		Parameters
 		----------
 		wavelength : scalar
 			The wavelength at which to calculate the phase screen.
+		dtype : data type or None
+			The data type in which to accumulate the phase screens. A reduced
+			precision (eg. float32) halves the memory bandwidth of this
+			memory-bound summation, at ~1e-7 relative accuracy, which is
+			usually sufficient for a phase in radians. If None, the native
+			data type of the layers is used. The default is None.
 
 		Returns
 		-------
@@ -240,9 +424,16 @@ class MultiLayerAtmosphere(OpticalElement):
 		if self.scintillation:
 			raise ValueError('Cannot get the unwrapped phase for an atmosphere with scintillation.')
 
-		unwrapped_phases = [layer.phase_for(wavelength) for layer in self.layers]
+		# Accumulate the per-layer phases in place to avoid stacking all
+		# phase screens into a single large intermediate array.
+		first_phase = self.layers[0].phase_for(wavelength)
+		grid = first_phase.grid
+		unwrapped_phase = np.array(first_phase, dtype=dtype)
+
+		for layer in self.layers[1:]:
+			np.add(unwrapped_phase, layer.phase_for(wavelength), out=unwrapped_phase)
 
-		return Field(np.sum(unwrapped_phases, axis=0), unwrapped_phases[-1].grid)
+		return Field(unwrapped_phase, grid)
 
 	@property
 	def scintillation(self):
@@ -267,17 +458,29 @@ class MultiLayerAtmosphere(OpticalElement):
 			l.evolve_until(t)
 		self._t = t
 
+		self._phasor_cache = {}
+
 	@property
 	def Cn_squared(self):  # noqa: N802
 		'''The total Cn^2 value of the simulated atmosphere.
 		'''
-		return np.sum([l.Cn_squared for l in self.layers])
+		if self._dirty:
+			self.calculate_propagators()
+
+		return self._layer_Cn_squared.sum()
 
 	@Cn_squared.setter
 	def Cn_squared(self, Cn_squared):  # noqa: N802
-		old_Cn_squared = self.Cn_squared
-		for l in self.layers:
-			l.Cn_squared = l.Cn_squared / old_Cn_squared * Cn_squared
+		if self._dirty:
+			self.calculate_propagators()
+
+		new_values = self._layer_Cn_squared * (Cn_squared / self._layer_Cn_squared.sum())
+
+		for l, value in zip(self.layers, new_values):
+			l.Cn_squared = value
+
+		self._layer_Cn_squared = new_values
+		self._phasor_cache = {}
 
 	@property
 	def outer_scale(self):
@@ -290,6 +493,9 @@ class MultiLayerAtmosphere(OpticalElement):
 		for l in self.layers:
 			l.outer_scale = L0
 
+		self._layer_outer_scales = np.full(len(self.layers), float(L0))
+		self._phasor_cache = {}
+
 	@property
 	def t(self):
 		'''The current time.
@@ -300,22 +506,106 @@ class MultiLayerAtmosphere(OpticalElement):
 	def t(self, t):
 		self.evolve_until(t)
 
-	def forward(self, wavefront):
+	def _combined_phasor_for(self, wavelength):
+		'''Get the combined phasor of all layers at a certain wavelength.
+
+		This is only valid for an atmosphere without scintillation, where the
+		whole atmosphere collapses into a single phase screen. The phasor is
+		cached per wavelength, and invalidated on evolution, reset and any
+		change to the layers, so repeated propagations through a frozen
+		atmosphere reduce to a single elementwise multiplication.
+
+		Parameters
+		----------
+		wavelength : scalar
+			The wavelength at which to calculate the phasor.
+		'''
+		if wavelength not in self._phasor_cache:
+			phase = self.phase_for(wavelength)
+			phasor = ne.evaluate('complex(cos(phase), sin(phase))', local_dict={'phase': phase})
+
+			self._phasor_cache[wavelength] = Field(phasor, phase.grid)
+
+		return self._phasor_cache[wavelength]
+
+	def forward(self, wavefront, inplace=False):
+		'''Propagate a wavefront through the atmosphere.
+
+		The electric field may carry leading tensor axes, eg. a batch of
+		wavefronts at the same wavelength. The phase screens broadcast over
+		these axes and the Fresnel propagators perform their FFTs batched
+		over the field axis, so the whole batch is propagated in vectorized
+		operations rather than a Python loop per wavefront.
+
+		Parameters
+		----------
+		wavefront : Wavefront
+			The wavefront to propagate.
+		inplace : boolean
+			Whether the wavefront may be modified in place. This avoids a
+			full copy of the electric field for callers that do not need
+			the input wavefront afterwards. The default is False.
+
+		Returns
+		-------
+		Wavefront
+			The propagated wavefront.
+		'''
 		if self._dirty:
 			self.calculate_propagators()
 
-		wf = wavefront.copy()
+		if inplace:
+			wf = wavefront
+		else:
+			wf = wavefront.copy()
+
+		if not self.scintillation:
+			wf.electric_field *= self._combined_phasor_for(wf.wavelength)
+			return wf
+
+		# The wavefront is already a private copy, so the layers are free
+		# to modify it in place. The propagators return fresh wavefronts.
 		for el in self.elements:
-			wf = el.forward(wf)
+			if isinstance(el, AtmosphericLayer):
+				wf = el.forward(wf, inplace=True)
+			else:
+				wf = el.forward(wf)
 		return wf
 
-	def backward(self, wavefront):
+	def backward(self, wavefront, inplace=False):
+		'''Propagate a wavefront backwards through the atmosphere.
+
+		Parameters
+		----------
+		wavefront : Wavefront
+			The wavefront to propagate.
+		inplace : boolean
+			Whether the wavefront may be modified in place. This avoids a
+			full copy of the electric field for callers that do not need
+			the input wavefront afterwards. The default is False.
+
+		Returns
+		-------
+		Wavefront
+			The propagated wavefront.
+		'''
 		if self._dirty:
 			self.calculate_propagators()
 
-		wf = wavefront.copy()
-		for el in reversed(self.elements):
-			wf = el.backward(wf)
+		if inplace:
+			wf = wavefront
+		else:
+			wf = wavefront.copy()
+
+		if not self.scintillation:
+			wf.electric_field *= self._combined_phasor_for(wf.wavelength).conj()
+			return wf
+
+		for el in self._elements_backward:
+			if isinstance(el, AtmosphericLayer):
+				wf = el.backward(wf, inplace=True)
+			else:
+				wf = el.backward(wf)
 		return wf
 
 def phase_covariance_von_karman(r0, L0):
@@ -333,16 +623,25 @@ def phase_covariance_von_karman(r0, L0):
 	Field generator
 		The phase covariance Field generator.
 	'''
+	# These prefactors only depend on r0 and L0, so compute them once
+	# instead of on every evaluation of the generator.
+	a = (L0 / r0)**(5 / 3)
+	b = gamma(11 / 6) / (2**(5 / 6) * np.pi**(8 / 3))
+	c = (24 / 5 * gamma(6 / 5))**(5 / 6)
+
+	prefactor = a * b * c
+	k = 2 * np.pi / L0
+
 	def func(grid):
-		r = grid.as_('polar').r + 1e-10
+		r = grid.as_('polar').r
 
-		a = (L0 / r0)**(5 / 3)
-		b = gamma(11 / 6) / (2**(5 / 6) * np.pi**(8 / 3))
-		c = (24 / 5 * gamma(6 / 5))**(5 / 6)
-		d = (2 * np.pi * r / L0)**(5 / 6)
-		e = kv(5 / 6, 2 * np.pi * r / L0)
+		x = ne.evaluate('k * (r + 1e-10)', local_dict={'k': k, 'r': r})
+		kv_x = _kv56(x)
 
-		return Field(a * b * c * d * e, grid)
+		variables = {'A': prefactor, 'x': x, 'kv_x': kv_x}
+		res = ne.evaluate('A * x**(5 / 6) * kv_x', local_dict=variables)
+
+		return Field(res, grid)
 	return func
 
 def phase_structure_function_von_karman(r0, L0):
@@ -360,19 +659,103 @@ def phase_structure_function_von_karman(r0, L0):
 	Field generator
 		The phase structure Field generator.
 	'''
+	# These prefactors only depend on r0 and L0, so compute them once
+	# instead of on every evaluation of the generator.
+	a = (L0 / r0)**(5 / 3)
+	b = 2**(1 / 6) * gamma(11 / 6) / np.pi**(8 / 3)
+	c = (24 / 5 * gamma(6 / 5))**(5 / 6)
+	d = gamma(5 / 6) / 2**(1 / 6)
+
+	prefactor = a * b * c
+	k = 2 * np.pi / L0
+
 	def func(grid):
-		r = grid.as_('polar').r + 1e-10
+		r = grid.as_('polar').r
 
-		a = (L0 / r0)**(5 / 3)
-		b = 2**(1 / 6) * gamma(11 / 6) / np.pi**(8 / 3)
-		c = (24 / 5 * gamma(6 / 5))**(5 / 6)
-		d = gamma(5 / 6) / 2**(1 / 6)
-		e = (2 * np.pi * r / L0)**(5 / 6)
-		f = kv(5 / 6, 2 * np.pi * r / L0)
+		x = ne.evaluate('k * (r + 1e-10)', local_dict={'k': k, 'r': r})
+		kv_x = _kv56(x)
 
-		return Field(a * b * c * (d - e * f), grid)
+		variables = {'A': prefactor, 'd': d, 'x': x, 'kv_x': kv_x}
+		res = ne.evaluate('A * (d - x**(5 / 6) * kv_x)', local_dict=variables)
+
+		return Field(res, grid)
 	return func
 
+def make_von_karman_covariance_operator(r0, L0, grid):
+	'''Make a fast operator applying the Von Karman phase covariance matrix.
+
+	On a regularly-spaced Cartesian grid the phase covariance matrix is
+	block-Toeplitz with Toeplitz blocks, so it can be embedded in a
+	circulant matrix and applied with FFTs in O(N log N) operations,
+	instead of the O(N^2) of a dense matrix-vector product. The
+	eigenvalues of the embedding are computed once when the operator is
+	made and reused for every application.
+
+	Parameters
+	----------
+	r0 : scalar
+		The Fried parameter in meters.
+	L0 : scalar
+		The outer scale in meters.
+	grid : Grid
+		The regularly-spaced Cartesian grid on which the covariance matrix
+		is defined.
+
+	Returns
+	-------
+	callable
+		A function that applies the covariance matrix to a vector defined
+		on `grid` and returns the result as a Field.
+
+	Raises
+	------
+	ValueError
+		When the grid is not Cartesian, regularly spaced and two-dimensional.
+	'''
+	if not grid.is_('cartesian') or not grid.is_regular or grid.ndim != 2:
+		raise ValueError('The grid must be a regularly-spaced two-dimensional Cartesian grid.')
+
+	covariance_function = phase_covariance_von_karman(r0, L0)
+
+	# Embed the covariance in a circulant matrix of twice the dimensions.
+	# As the covariance only depends on the separation, the embedding is
+	# described by the covariance evaluated at the wrapped displacements.
+	dims = grid.dims
+	embedded_dims = 2 * dims
+
+	j = np.arange(embedded_dims[0])
+	i = np.arange(embedded_dims[1])
+	dx = np.minimum(j, embedded_dims[0] - j) * grid.delta[0]
+	dy = np.minimum(i, embedded_dims[1] - i) * grid.delta[1]
+
+	displacements = CartesianGrid(SeparatedCoords((dx, dy)))
+	embedding = covariance_function(displacements).shaped
+
+	eigenvalues = np.fft.rfft2(embedding)
+
+	def apply_covariance(vec):
+		'''Apply the Von Karman phase covariance matrix to `vec`.
+
+		Parameters
+		----------
+		vec : array_like
+			The vector to apply the covariance matrix to, defined on the
+			grid of the operator.
+
+		Returns
+		-------
+		Field
+			The covariance matrix applied to `vec`.
+		'''
+		res = np.zeros((embedded_dims[1], embedded_dims[0]))
+		res[:dims[1], :dims[0]] = np.reshape(vec, (dims[1], dims[0]))
+
+		res = np.fft.irfft2(np.fft.rfft2(res) * eigenvalues, s=res.shape)
+
+		return Field(res[:dims[1], :dims[0]].ravel(), grid)
+
+	return apply_covariance
+
 def power_spectral_density_von_karman(r0, L0):
 	'''Return a Field generator for the power spectral density function for Von Karman turbulence.
 
@@ -388,12 +771,18 @@ def power_spectral_density_von_karman(r0, L0):
 	Field generator
 		The power spectral density Field generator.
 	'''
+	# These prefactors only depend on r0 and L0, so compute them once
+	# instead of on every evaluation of the generator.
+	prefactor = 0.0229 * r0**(-5 / 3) * (2 * np.pi)**(11 / 3)
+	u0 = 2 * np.pi / L0
+
 	def func(grid):
-		u = grid.as_('polar').r + 1e-10
-		u0 = 2 * np.pi / L0
+		r = grid.as_('polar').r
 
-		res = 0.0229 * ((u**2 + u0**2) / (2 * np.pi)**2)**(-11 / 6.) * r0**(-5 / 3)
-		res[u < 1e-9] = 0
+		# The where() zeroes the DC component (u < 1e-9 only occurs for
+		# r = 0) in the same fused pass, instead of a separate masked write.
+		variables = {'A': prefactor, 'r': r, 'u0': u0}
+		res = ne.evaluate('where(r + 1e-10 < 1e-9, 0, A * ((r + 1e-10)**2 + u0**2)**(-11 / 6))', local_dict=variables)
 
 		return Field(res, grid)
 	return func
@@ -401,16 +790,19 @@ def power_spectral_density_von_karman(r0, L0):
 def Cn_squared_from_fried_parameter(r0, wavelength=500e-9):  # noqa: N802
 	'''Calculate the integrated Cn^2 for a certain Fried parameter.
 
+	All arguments broadcast against each other following the usual numpy
+	rules, so whole parameter scans can be evaluated in a single call.
+
 	Parameters
 	----------
-	r0 : scalar
+	r0 : scalar or array_like
 		The Fried parameter in meters.
-	wavelength : scalar
+	wavelength : scalar or array_like
 		The wavelength in meters at which the Fried parameter is measured (default: 500nm).
 
 	Returns
 	-------
-	scalar
+	scalar or ndarray
 		The integrated Cn^2 value for the atmosphere.
 	'''
 	k = 2 * np.pi / wavelength
@@ -419,16 +811,19 @@ def Cn_squared_from_fried_parameter(r0, wavelength=500e-9):  # noqa: N802
 def fried_parameter_from_Cn_squared(Cn_squared, wavelength=500e-9):  # noqa: N802
 	'''Calculate the Fried parameter from the integrated Cn^2.
 
+	All arguments broadcast against each other following the usual numpy
+	rules, so whole parameter scans can be evaluated in a single call.
+
 	Parameters
 	----------
-	r0 : scalar
+	Cn_squared : scalar or array_like
 		The integrated Cn^2 value for the atmosphere.
-	wavelength : scalar
+	wavelength : scalar or array_like
 		The wavelength in meters at which to calculate the Fried parameter (default: 500nm).
 
 	Returns
 	-------
-	scalar
+	scalar or ndarray
 		The Fried parameter in meters.
 	'''
 	k = 2 * np.pi / wavelength
@@ -441,16 +836,19 @@ def seeing_to_fried_parameter(seeing, wavelength=500e-9):
 	is the FWHM of the seeing, :math:`\lambda` is the wavelength and
 	:math:`r_0` is the Fried parameter.
 
+	All arguments broadcast against each other following the usual numpy
+	rules, so whole parameter scans can be evaluated in a single call.
+
 	Parameters
 	----------
-	seeing : scalar
+	seeing : scalar or array_like
 		The FWHM of the seeing in arcsec.
-	wavelength : scalar
+	wavelength : scalar or array_like
 		The wavelength in meters at which the seeing is measured (default: 500nm).
 
 	Returns
 	-------
-	scalar
+	scalar or ndarray
 		The Fried parameter in meters at the specified wavelength.
 	'''
 	return 0.98 * wavelength / np.radians(seeing / 3600)
@@ -462,16 +860,19 @@ def fried_parameter_to_seeing(r0, wavelength=500e-9):
 	is the FWHM of the seeing, :math:`\lambda` is the wavelength and
 	:math:`r_0` is the Fried parameter.
 
+	All arguments broadcast against each other following the usual numpy
+	rules, so whole parameter scans can be evaluated in a single call.
+
 	Parameters
 	----------
-	r0 : scalar
+	r0 : scalar or array_like
 		The Fried parameter in meters.
-	wavelength : scalar
+	wavelength : scalar or array_like
 		The wavelength in meters at which the Fried parameter is measured (default: 500nm).
 
 	Returns
 	-------
-	scalar
+	scalar or ndarray
 		The FWHM of the seeing in arcsec at the specified wavelength.
 	'''
 	return np.degrees(0.98 * wavelength / r0) * 3600
@@ -83,6 +83,7 @@ class FiniteAtmosphericLayer(AtmosphericLayer):
 		self._noise = self.noise_factory.make_random(self.rng)
 
 		self._achromatic_screen = None
+		self._invalidate_phasor_cache()
 
 	@property
 	def noise(self):
@@ -131,6 +132,7 @@ class FiniteAtmosphericLayer(AtmosphericLayer):
 		'''
 		self.center = self.velocity * t
 		self._achromatic_screen = None
+		self._invalidate_phasor_cache()
 
 	@property
 	def Cn_squared(self):  # noqa: N802
@@ -142,6 +144,7 @@ class FiniteAtmosphericLayer(AtmosphericLayer):
 	def Cn_squared(self, Cn_squared):  # noqa: N802
 		self._Cn_squared = Cn_squared
 		self._noise = None
+		self._invalidate_phasor_cache()
 
 	@property
 	def outer_scale(self):
@@ -153,3 +156,4 @@ class FiniteAtmosphericLayer(AtmosphericLayer):
 	def L0(self, L0):  # noqa: N802
 		self._L0 = L0
 		self._noise = None
+		self._invalidate_phasor_cache()
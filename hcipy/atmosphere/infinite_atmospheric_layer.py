@@ -20,7 +20,12 @@ class InfiniteAtmosphericLayer(AtmosphericLayer):
 	column or row in any direction. Each new row/column is based on
 	a  stencil, which contains the last few rows/columns in addition
 	to a few pixels spread out more into the phase screen to capture
-	the low-order aberrations.
+	the low-order aberrations. As only a single screen the size of the
+	input grid is kept in memory, the memory use is independent of the
+	total simulated time. The operator matrices are derived from the
+	Von Karman phase covariance function, and both they and the
+	extrusion matrix-vector products are kept in double precision to
+	limit the accumulation of round-off over many extrusions.
 
 	.. [Assemat2006] François Assémat, Richard W. Wilson, and Eric
 		Gendron, "Method for simulating infinitely long and non
@@ -227,7 +232,9 @@ class InfiniteAtmosphericLayer(AtmosphericLayer):
 			A = self.A_vertical
 			B = self.B_vertical
 
-		stencil_data = screen[stencil]
+		# The extrusion is performed in double precision to limit the
+		# accumulation of round-off error over many extrusions.
+		stencil_data = screen[stencil].astype('float64', copy=False)
 		random_data = self.rng.normal(0, 1, size=B.shape[1])
 		new_slice = A.dot(stencil_data) + B.dot(random_data) * np.sqrt(self._Cn_squared)
 
@@ -288,6 +295,7 @@ class InfiniteAtmosphericLayer(AtmosphericLayer):
 
 		self.center = np.zeros(2)
 		self._t = 0
+		self._invalidate_phasor_cache()
 
 	def evolve_until(self, t):
 		'''Evolve the atmospheric layer until a certain time.
@@ -356,6 +364,8 @@ class InfiniteAtmosphericLayer(AtmosphericLayer):
 		else:
 			self._shifted_achromatic_screen = self._achromatic_screen
 
+		self._invalidate_phasor_cache()
+
 	@property
 	def Cn_squared(self):  # noqa: N802
 		'''The integrated strength of the turbulence for this layer.
@@ -365,6 +375,7 @@ class InfiniteAtmosphericLayer(AtmosphericLayer):
 	@Cn_squared.setter
 	def Cn_squared(self, Cn_squared):  # noqa: N802
 		self._Cn_squared = Cn_squared
+		self._invalidate_phasor_cache()
 
 	@property
 	def outer_scale(self):
@@ -377,3 +388,4 @@ class InfiniteAtmosphericLayer(AtmosphericLayer):
 		self._L0 = L0
 
 		self._recalculate_matrices()
+		self._invalidate_phasor_cache()
@@ -28,6 +28,8 @@ class ModalAdaptiveOpticsLayer(AtmosphericLayer):
 			self.corrected_coeffs.pop(0)
 		self.corrected_coeffs.append(coeffs)
 
+		self._invalidate_phasor_cache()
+
 	@property
 	def Cn_squared(self):  # noqa: N802
 		return self.layer.Cn_squared
@@ -35,6 +37,7 @@ class ModalAdaptiveOpticsLayer(AtmosphericLayer):
 	@Cn_squared.setter
 	def Cn_squared(self, Cn_squared):  # noqa: N802
 		self.layer.Cn_squared = Cn_squared
+		self._invalidate_phasor_cache()
 
 	@property
 	def outer_scale(self):
@@ -43,7 +46,10 @@ class ModalAdaptiveOpticsLayer(AtmosphericLayer):
 	@outer_scale.setter
 	def L0(self, L0):  # noqa: N802
 		self.layer.L0 = L0
+		self._invalidate_phasor_cache()
 
 	def reset(self):
 		self.corrected_coeffs = []
 		self.layer.reset()
+
+		self._invalidate_phasor_cache()
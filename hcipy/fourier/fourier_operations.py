@@ -5,10 +5,12 @@ from ..field import Field, field_dot, field_conjugate_transpose
 
 try:
 	import mkl_fft as _fft_module
-	_use_mkl = True
+	_fft_flavor = 'mkl'
 except ImportError:
-	_fft_module = np.fft
-	_use_mkl = False
+	# Fall back to the pocketfft implementation in scipy, which can
+	# distribute the FFTs over all cores.
+	import scipy.fft as _fft_module
+	_fft_flavor = 'scipy'
 
 class FourierFilter(object):
 	'''A filter in the Fourier domain.
@@ -117,10 +119,9 @@ class FourierFilter(object):
 			f[c] = field.shaped
 
 		# Don't overwrite f if it's the input array.
-		if _use_mkl:
-			kwargs = {'overwrite_x': self.cutout is not None and field.grid.ndim > 1}
-		else:
-			kwargs = {}
+		kwargs = {'overwrite_x': self.cutout is not None and field.grid.ndim > 1}
+		if _fft_flavor == 'scipy':
+			kwargs['workers'] = -1
 		f = _fft_module.fftn(f, axes=tuple(range(-self.input_grid.ndim, 0)), **kwargs)
 
 		if (self._transfer_function.ndim - self.internal_grid.ndim) == 2:
@@ -144,10 +145,9 @@ class FourierFilter(object):
 
 			f *= tf
 
-		if _use_mkl:
-			kwargs = {'overwrite_x': True}
-		else:
-			kwargs = {}
+		kwargs = {'overwrite_x': True}
+		if _fft_flavor == 'scipy':
+			kwargs['workers'] = -1
 		f = _fft_module.ifftn(f, axes=tuple(range(-self.input_grid.ndim, 0)), **kwargs)
 
 		s = f.shape[:-self.internal_grid.ndim] + (-1,)
@@ -238,6 +238,20 @@ def test_multi_layer_atmosphere():
 	wf_out2 = atmospheric_model.forward(wf)
 	assert not np.allclose(wf_out.electric_field, wf_out2.electric_field)
 
+def test_multi_layer_atmosphere_phase_dtype():
+	wavelength = 500e-9
+
+	pupil_grid = make_pupil_grid(64, 1.5)
+	layers = make_standard_atmospheric_layers(pupil_grid)
+	atmospheric_model = MultiLayerAtmosphere(layers, scintillation=False)
+
+	phase = atmospheric_model.phase_for(wavelength)
+	phase_float32 = atmospheric_model.phase_for(wavelength, dtype='float32')
+
+	assert phase.dtype == np.float64
+	assert phase_float32.dtype == np.float32
+	assert np.allclose(phase, phase_float32, rtol=1e-5, atol=1e-3)
+
 def test_las_campanas_atmosphere():
 	r0 = 0.1
 	wavelength = 500e-9
@@ -266,6 +280,58 @@ def test_fried_parameter_seeing():
 
 		assert np.allclose(seeing_recovered, seeing)
 
+@pytest.mark.parametrize('scintillation', [False, True])
+def test_multi_layer_atmosphere_batched_wavefronts(scintillation):
+	wavelength = 500e-9
+	num_wavefronts = 3
+
+	pupil_grid = make_pupil_grid(64, 1.5)
+	layers = make_standard_atmospheric_layers(pupil_grid)
+	atmospheric_model = MultiLayerAtmosphere(layers, scintillation=scintillation)
+
+	rng = np.random.default_rng(0)
+	batch = Field(rng.normal(size=(num_wavefronts, pupil_grid.size)) + 0j, pupil_grid)
+
+	wf_out = atmospheric_model.forward(Wavefront(batch, wavelength))
+
+	# A batched propagation should be identical to propagating each wavefront separately.
+	for i in range(num_wavefronts):
+		wf_i = atmospheric_model.forward(Wavefront(Field(batch[i], pupil_grid), wavelength))
+
+		assert np.allclose(wf_out.electric_field[i], wf_i.electric_field)
+
+def test_von_karman_covariance_operator():
+	r0 = 0.1
+	L0 = 10
+
+	grid = make_uniform_grid([12, 10], [1.2, 1])
+
+	# Build the dense covariance matrix from all pairwise separations.
+	x = np.concatenate([grid.x - xx for xx in grid.x])
+	y = np.concatenate([grid.y - yy for yy in grid.y])
+	separations = CartesianGrid(UnstructuredCoords((x, y)))
+
+	covariance_matrix = np.asarray(phase_covariance_von_karman(r0, L0)(separations)).reshape((grid.size, grid.size))
+
+	apply_covariance = make_von_karman_covariance_operator(r0, L0, grid)
+
+	rng = np.random.default_rng(0)
+	for i in range(3):
+		vec = rng.normal(size=grid.size)
+
+		assert np.allclose(apply_covariance(vec), covariance_matrix.dot(vec))
+
+def test_atmospheric_parameter_conversions_broadcast():
+	r0 = np.array([0.1, 0.2, 0.3])
+	seeing = np.array([0.5, 1, 2])
+	wavelengths = np.array([500e-9, 800e-9, 2.2e-6])
+
+	# Array evaluation should match elementwise scalar evaluation.
+	assert np.allclose(Cn_squared_from_fried_parameter(r0, wavelengths), [Cn_squared_from_fried_parameter(r, w) for r, w in zip(r0, wavelengths)])
+	assert np.allclose(fried_parameter_from_Cn_squared(Cn_squared_from_fried_parameter(r0, wavelengths), wavelengths), r0)
+	assert np.allclose(seeing_to_fried_parameter(seeing, wavelengths), [seeing_to_fried_parameter(s, w) for s, w in zip(seeing, wavelengths)])
+	assert np.allclose(fried_parameter_to_seeing(seeing_to_fried_parameter(seeing, wavelengths), wavelengths), seeing)
+
 def test_phase_covariance_phase_structure_function_von_karman():
 	grid = make_uniform_grid([256, 256], [1, 1], has_center=True)
 